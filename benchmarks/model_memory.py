@@ -0,0 +1,123 @@
+"""Resident memory per serving worker with and without memory-mapped model loading.
+
+Trains a tree ensemble on synthetic wine-shaped data, saves it the way
+ModelTrainer does, then starts N worker processes that each load the model and
+score a batch. Every worker reports its memory from /proc/self/smaps_rollup
+while all of them are alive, so PSS splits shared pages fairly between them.
+
+    python -m benchmarks.model_memory --workers 4 --estimators 200
+"""
+import argparse
+import json
+import multiprocessing as mp
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+from sklearn.ensemble import HistGradientBoostingRegressor, RandomForestRegressor
+
+from benchmarks.processes import collect_results
+
+
+N_FEATURES = 11
+
+
+def memory_kb() -> dict:
+    fields = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return {
+        "rss"     : fields["Rss"],
+        "pss"     : fields["Pss"],
+        "private" : fields["Private_Clean"] + fields["Private_Dirty"],
+    }
+
+
+_preloaded = None
+
+
+def worker(model_path: str, mmap_mode, barrier, results):
+    # No path: use the model inherited from the parent (or none, for the baseline)
+    model = joblib.load(model_path, mmap_mode=mmap_mode) if model_path else _preloaded
+    if model is not None:
+        model.predict(np.random.default_rng(0).random((2000, N_FEATURES)))
+    # Measure only once every worker has its model in memory
+    barrier.wait()
+    results.put(memory_kb())
+    barrier.wait()
+
+
+def measure(model_path: str, mmap_mode, n_workers: int, start_method: str = "spawn") -> dict:
+    ctx = mp.get_context(start_method)
+    barrier = ctx.Barrier(n_workers)
+    results = ctx.Queue()
+    procs = [ctx.Process(target=worker, args=(model_path, mmap_mode, barrier, results)) for _ in range(n_workers)]
+    for p in procs:
+        p.start()
+    # If one worker dies the rest would wait at the barrier forever; collect_results
+    # terminates them and the whole mode is reported as failed
+    rows, error = collect_results(results, procs)
+    if error is not None:
+        return {"error": error}
+    return {k: sum(r[k] for r in rows) / len(rows) / 1024 for k in rows[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--model", choices=["forest", "hgb"], default="forest")
+    parser.add_argument("--estimators", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--output", type=Path, default=Path("artifacts/benchmarks/model_memory.json"))
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    X = rng.random((args.rows, N_FEATURES))
+    y = X @ rng.random(N_FEATURES) + rng.normal(0, 0.1, args.rows)
+
+    start = time.perf_counter()
+    if args.model == "forest":
+        model = RandomForestRegressor(n_estimators=args.estimators, n_jobs=-1, random_state=42)
+    else:
+        model = HistGradientBoostingRegressor(max_iter=args.estimators, max_leaf_nodes=255, early_stopping=False, random_state=42)
+    model.fit(X, y)
+    print(f"Trained {args.model} ({args.estimators} estimators) on {args.rows} rows in {time.perf_counter() - start:.1f}s")
+
+    report = {"model": args.model, "workers": args.workers, "estimators": args.estimators, "rows": args.rows}
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = os.path.join(tmp, "model.joblib")
+        joblib.dump(model, model_path, compress=0)
+        report["model_file_mb"] = os.path.getsize(model_path) / 1024 / 1024
+        del model
+
+        report["baseline"] = measure(None, None, args.workers)
+        for label, mmap_mode in (("heap", None), ("mmap", "r")):
+            report[label] = measure(model_path, mmap_mode, args.workers)
+
+        # Preload in the parent, then fork: what `gunicorn --preload` gives the app
+        global _preloaded
+        _preloaded = joblib.load(model_path, mmap_mode="r")
+        report["fork"] = measure(None, None, args.workers, start_method="fork")
+
+    print(f"\nModel file: {report['model_file_mb']:.1f} MB, {args.workers} workers (MB per worker)")
+    print(f"{'mode':<10}{'rss':>10}{'pss':>10}{'private':>10}")
+    for label in ("baseline", "heap", "mmap", "fork"):
+        m = report[label]
+        if "error" in m:
+            print(f"{label:<10}  FAILED {m['error']}")
+            continue
+        print(f"{label:<10}{m['rss']:>10.1f}{m['pss']:>10.1f}{m['private']:>10.1f}")
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=4))
+    print(f"\nReport written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""End-to-end pipeline scaling on synthetic data, fully offline.
+
+For every size, builds a fresh working directory with a copy of config/,
+params.yaml and schema.yaml whose data_ingestion.source_URL points at a
+generated file:// zip, then runs each stage in its own process and records
+wall time and peak RSS. Results go to a JSON and a markdown report.
+
+    python -m benchmarks.pipeline_scaling --sizes 1e4,1e5,1e6,1e7
+"""
+import argparse
+import importlib
+import json
+import multiprocessing as mp
+import os
+import resource
+import shutil
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+from benchmarks.processes import collect_results
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# stage -> (pipeline module, pipeline class, entry point)
+STAGES = {
+    "synthetic_data"      : ("synthetic_data", "SyntheticDataPipeline", "init_synthetic_data"),
+    "data_ingestion"      : ("data_ingestion", "DataIngestionPipeline", "init_data_ingestion"),
+    "data_validation"     : ("data_validation", "DataValidationPipeline", "init_data_validation"),
+    "data_transformation" : ("data_transformation", "DataTransformationPipeline", "init_data_transformation"),
+    "model_training"      : ("model_trainer", "ModelTrainingPipeline", "init_model_training"),
+    "model_evaluation"    : ("model_evaluation", "ModelEvaluationPipeline", "init_model_evaluation"),
+}
+
+
+def run_stage(stage: str, workdir: str, rows: int, results):
+    # Chdir before importing the package: logs/ and every artifacts/ path are relative
+    os.chdir(workdir)
+    sys.path.insert(0, str(REPO_ROOT))
+    os.environ.pop("DAGSHUB_REPO_URL", None)
+    os.environ["MLFLOW_TRACKING_URI"] = f"sqlite:///{Path(workdir) / 'mlflow.db'}"
+
+    error = None
+    try:
+        # Import only this stage's pipeline so one missing optional dependency
+        # (mlflow, dagshub) fails that stage and not every other one
+        module_name, class_name, method = STAGES[stage]
+        module = importlib.import_module(f"src.end_to_end_ds.pipeline.{module_name}")
+        runner = getattr(getattr(module, class_name)(), method)
+    except Exception as e:
+        runner, error = None, f"{type(e).__name__}: {e}"
+
+    # Time and memory are measured after imports, so they cover only the stage's work
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    try:
+        if runner is not None:
+            runner(rows) if stage == "synthetic_data" else runner()
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    seconds = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    results.put({
+        "stage"         : stage,
+        "seconds"       : seconds,
+        "peak_rss_mb"   : peak / 1024,
+        "stage_rss_mb"  : (peak - baseline) / 1024,
+        "error"         : error,
+    })
+
+
+def _mb(value) -> str:
+    return "-" if value is None else f"{value:.0f}"
+
+
+def prepare_workdir(workdir: Path) -> Path:
+    if workdir.exists():
+        shutil.rmtree(workdir)
+    (workdir / "config").mkdir(parents=True)
+    for name in ("params.yaml", "schema.yaml"):
+        shutil.copy(REPO_ROOT / name, workdir / name)
+
+    with open(REPO_ROOT / "config" / "config.yaml") as f:
+        config = yaml.safe_load(f)
+    config["data_ingestion"]["source_URL"] = (workdir / config["synthetic_data"]["zip_file"]).as_uri()
+    with open(workdir / "config" / "config.yaml", "w") as f:
+        yaml.safe_dump(config, f, sort_keys=False)
+    return workdir
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="1e4,1e5,1e6", help="comma separated row counts, e.g. 1e4,1e5,1e6,1e7,1e8")
+    parser.add_argument("--workdir", type=Path, default=Path("artifacts/benchmarks/pipeline_scaling"))
+    parser.add_argument("--keep", action="store_true", help="keep each size's working directory")
+    args = parser.parse_args()
+
+    sizes = [int(float(s)) for s in args.sizes.split(",")]
+    workdir_root = args.workdir.resolve()
+    ctx = mp.get_context("spawn")
+
+    report = []
+    for rows in sizes:
+        workdir = prepare_workdir(workdir_root / f"rows_{rows}")
+        print(f"\n== {rows:,} rows ==")
+        for stage in STAGES:
+            results = ctx.Queue()
+            p = ctx.Process(target=run_stage, args=(stage, str(workdir), rows, results))
+            start = time.perf_counter()
+            p.start()
+            collected, error = collect_results(results, [p])
+            if collected:
+                result = collected[0]
+            else:
+                # Died without reporting (e.g. OOM-killed): only the wall time is known
+                result = {"stage": stage, "seconds": time.perf_counter() - start, "peak_rss_mb": None, "stage_rss_mb": None, "error": error}
+
+            result["rows"] = rows
+            report.append(result)
+            status = f"FAILED {result['error']}" if result["error"] else "ok"
+            print(f"  {stage:<20}{result['seconds']:>9.2f}s{_mb(result['peak_rss_mb']):>10} MB peak  {status}")
+            if result["error"]:
+                break
+
+        if not args.keep:
+            shutil.rmtree(workdir)
+
+    workdir_root.mkdir(parents=True, exist_ok=True)
+    (workdir_root / "report.json").write_text(json.dumps(report, indent=4))
+
+    lines = ["| rows | stage | seconds | peak RSS MB | stage RSS MB | status |", "|---|---|---|---|---|---|"]
+    for r in report:
+        status = r["error"] or "ok"
+        lines.append(f"| {r['rows']:,} | {r['stage']} | {r['seconds']:.2f} | {_mb(r['peak_rss_mb'])} | {_mb(r['stage_rss_mb'])} | {status} |")
+    (workdir_root / "report.md").write_text("\n".join(lines) + "\n")
+    print(f"\nReport written to {workdir_root / 'report.json'} and {workdir_root / 'report.md'}")
+
+
+if __name__ == "__main__":
+    main()
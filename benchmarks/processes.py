@@ -0,0 +1,45 @@
+"""Collecting results from benchmark child processes.
+
+Each benchmark runs its measurements in child processes that put one result
+on a queue. A child killed by the OOM killer (the expected outcome for the
+largest sizes) never puts anything, so waiting with a bare `Queue.get()`
+would hang the whole run.
+"""
+import queue
+
+
+def exit_reason(exitcode: int) -> str:
+    if exitcode is None:
+        return "still running"
+    if exitcode < 0:
+        return f"killed ({exitcode})"
+    if exitcode > 0:
+        return f"exited with code {exitcode}"
+    return "exited without a result"
+
+
+def collect_results(results, processes: list, poll_seconds: float = 1.0):
+    # Returns (rows, error). error is None when every process reported, else it
+    # says how the first failed process ended; the rest are then terminated
+    rows = []
+    error = None
+    while len(rows) < len(processes):
+        # Sampled before the get: a child puts its result before it exits, so if
+        # all of them had already exited and the get times out, nothing is coming
+        finished = all(p.exitcode is not None for p in processes)
+        try:
+            rows.append(results.get(timeout=poll_seconds))
+            continue
+        except queue.Empty:
+            pass
+
+        failed = [p for p in processes if p.exitcode not in (None, 0)]
+        if failed or finished:
+            error = exit_reason(failed[0].exitcode if failed else 0)
+            break
+
+    for p in processes:
+        if error is not None and p.is_alive():
+            p.terminate()
+        p.join()
+    return rows, error
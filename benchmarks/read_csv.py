@@ -0,0 +1,96 @@
+"""Parse time and memory of default vs schema-typed CSV reads.
+
+Writes a synthetic wine CSV with N rows, then reads it in a fresh process per
+variant so peak RSS is not polluted by the previous one:
+
+    default  pd.read_csv with type inference
+    typed    read_csv_with_schema (dtype + usecols from schema.yaml)
+    float32  read_csv_with_schema(float32=True)
+
+    python -m benchmarks.read_csv --rows 10000000
+"""
+import argparse
+import json
+import multiprocessing as mp
+import resource
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.processes import collect_results
+
+
+COLUMNS = [
+    "fixed acidity", "volatile acidity", "citric acid", "residual sugar", "chlorides",
+    "free sulfur dioxide", "total sulfur dioxide", "density", "pH", "sulphates", "alcohol",
+]
+
+
+def write_csv(path: Path, rows: int, chunk: int = 1_000_000):
+    rng = np.random.default_rng(42)
+    for start in range(0, rows, chunk):
+        n = min(chunk, rows - start)
+        df = pd.DataFrame(rng.random((n, len(COLUMNS))).round(4), columns=COLUMNS)
+        df["quality"] = rng.integers(3, 9, n)
+        # An extra column the schema does not know about, like an id in real uploads
+        df["sample_id"] = np.arange(start, start + n)
+        df.to_csv(path, mode="w" if start == 0 else "a", header=start == 0, index=False)
+
+
+def read(variant: str, path: str, results):
+    from src.end_to_end_ds.utils.common import read_csv_with_schema
+
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if variant == "default":
+        df = pd.read_csv(path)
+    else:
+        df = read_csv_with_schema(path, float32=variant == "float32")
+    seconds = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    results.put({
+        "variant"     : variant,
+        "seconds"     : seconds,
+        "frame_mb"    : df.memory_usage(deep=True).sum() / 1024 / 1024,
+        "peak_rss_mb" : (peak - before) / 1024,
+        "columns"     : len(df.columns),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--data", type=Path, default=Path("artifacts/benchmarks/read_csv.csv"))
+    parser.add_argument("--output", type=Path, default=Path("artifacts/benchmarks/read_csv.json"))
+    args = parser.parse_args()
+
+    args.data.parent.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    write_csv(args.data, args.rows)
+    print(f"Wrote {args.rows} rows ({args.data.stat().st_size / 1024 / 1024:.0f} MB) in {time.perf_counter() - start:.1f}s")
+
+    ctx = mp.get_context("spawn")
+    report = {"rows": args.rows, "results": []}
+    for variant in ("default", "typed", "float32"):
+        results = ctx.Queue()
+        p = ctx.Process(target=read, args=(variant, str(args.data), results))
+        p.start()
+        collected, error = collect_results(results, [p])
+        report["results"].append(collected[0] if collected else {"variant": variant, "error": error})
+
+    print(f"\n{'variant':<10}{'seconds':>10}{'frame MB':>12}{'peak RSS MB':>14}{'columns':>9}")
+    for r in report["results"]:
+        if r.get("error"):
+            print(f"{r['variant']:<10}  FAILED {r['error']}")
+            continue
+        print(f"{r['variant']:<10}{r['seconds']:>10.2f}{r['frame_mb']:>12.1f}{r['peak_rss_mb']:>14.1f}{r['columns']:>9}")
+
+    args.output.write_text(json.dumps(report, indent=4))
+    print(f"\nReport written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import os
+import uuid
 from pathlib import Path
 from typing import Dict, Any, List
 
-from flask import Flask, render_template, request, redirect, url_for, flash, send_from_directory
+from flask import Flask, render_template, request, redirect, url_for, flash, send_file, jsonify, abort
 
 from src.end_to_end_ds import logger
 from src.end_to_end_ds.pipeline.data_ingestion import DataIngestionPipeline
@@ -12,7 +13,10 @@ from src.end_to_end_ds.pipeline.data_validation import DataValidationPipeline
 from src.end_to_end_ds.pipeline.data_transformation import DataTransformationPipeline
 from src.end_to_end_ds.pipeline.model_trainer import ModelTrainingPipeline
 from src.end_to_end_ds.pipeline.model_evaluation import ModelEvaluationPipeline
-from src.end_to_end_ds.pipeline.prediction import PredictionPipeline
+from src.end_to_end_ds.pipeline.model_comparison import ModelComparisonPipeline
+from src.end_to_end_ds.pipeline.prediction import PredictionPipeline, get_prediction_cache, preload_model
+from src.end_to_end_ds.pipeline.batch_prediction import get_batch_prediction
+from src.end_to_end_ds.pipeline.model_monitoring import get_model_monitoring
 from src.end_to_end_ds.utils.common import read_yaml, create_directories
 from src.end_to_end_ds.config.configuration import ConfigurationManager
 
@@ -29,6 +33,16 @@ ARTIFACTS_DIR = BASE_DIR / "artifacts"
 UPLOAD_DIR = ARTIFACTS_DIR / "uploads"
 create_directories([str(ARTIFACTS_DIR), str(UPLOAD_DIR)])
 
+# Load the model at import so pre-forked workers share it instead of each loading a copy
+# A missing or broken model must not stop the app: /run/model_training is how it gets fixed
+try:
+    preload_model()
+except FileNotFoundError:
+    logger.info("No trained model yet, skipping preload")
+except Exception as e:
+    logger.exception(e)
+    logger.warning("Model could not be preloaded, starting without it")
+
 
 def get_schema_columns() -> List[str]:
     try:
@@ -85,6 +99,8 @@ def run_stage(stage: str):
             ModelTrainingPipeline().init_model_training()
         elif stage == "model_evaluation":
             ModelEvaluationPipeline().init_model_evaluation()
+        elif stage == "model_comparison":
+            ModelComparisonPipeline().init_model_comparison()
         elif stage == "all":
             DataIngestionPipeline().init_data_ingestion()
             DataValidationPipeline().init_data_validation()
@@ -104,36 +120,38 @@ def run_stage(stage: str):
 
 @app.route("/metrics")
 def metrics_page():
-    return render_template("metrics.html", metrics=latest_metrics())
+    return render_template("metrics.html", metrics=latest_metrics(), drift=get_model_monitoring().report())
+
+
+@app.route("/monitoring/drift")
+def drift_report():
+    return jsonify(get_model_monitoring().report())
 
 
 @app.route("/predict", methods=["GET", "POST"])
 def predict():
     feature_columns = get_schema_columns()
     prediction_result = None
-    batch_result_path = None
+    job_id = request.args.get("job_id")
 
     if request.method == "POST":
+        save_path = None
         try:
-            predictor = PredictionPipeline()
-
             if "file" in request.files and request.files["file"].filename:
                 uploaded = request.files["file"]
-                save_path = UPLOAD_DIR / uploaded.filename
+                # Scoring happens on the batch worker pool; the request only stores the file
+                save_path = UPLOAD_DIR / f"{uuid.uuid4().hex}.upload"
                 uploaded.save(save_path)
 
-                import pandas as pd
-                df = pd.read_csv(save_path)
-                preds = predictor.predict(df)
-
-                df_out = df.copy()
-                df_out["prediction"] = preds
-                output_path = UPLOAD_DIR / f"predictions_{uploaded.filename}"
-                df_out.to_csv(output_path, index=False)
-                batch_result_path = output_path.name
-                flash("Batch predictions completed", "success")
+                job_id = get_batch_prediction().submit(
+                    save_path,
+                    Path(uploaded.filename).name,
+                    request.form.get("output_format") or None,
+                )
+                flash(f"Batch prediction job {job_id} queued", "success")
             else:
                 # Single prediction from form
+                predictor = PredictionPipeline()
                 import pandas as pd
                 data = {}
                 for col in feature_columns:
@@ -151,19 +169,41 @@ def predict():
                 flash("Prediction completed", "success")
         except Exception as e:
             logger.exception(e)
+            # submit() moves the upload into its job folder; anything left here was rejected
+            if save_path is not None:
+                save_path.unlink(missing_ok=True)
             flash(f"Prediction failed: {e}", "danger")
 
     return render_template(
         "predict.html",
         feature_columns=feature_columns,
         prediction_result=prediction_result,
-        batch_result_path=batch_result_path,
+        job_id=job_id,
     )
 
 
-@app.route("/downloads/<path:filename>")
-def download_file(filename: str):
-    return send_from_directory(UPLOAD_DIR, filename, as_attachment=True)
+@app.route("/predict/cache")
+def prediction_cache_stats():
+    return jsonify(get_prediction_cache().stats())
+
+
+@app.route("/jobs/<job_id>")
+def job_status(job_id: str):
+    try:
+        return jsonify(get_batch_prediction().status(job_id))
+    except KeyError:
+        abort(404)
+
+
+@app.route("/jobs/<job_id>/download")
+def job_download(job_id: str):
+    try:
+        output_path = get_batch_prediction().output_path(job_id)
+    except KeyError:
+        abort(404)
+    except FileNotFoundError:
+        abort(409)
+    return send_file(output_path.resolve(), as_attachment=True, download_name=output_path.name)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,204 @@
+import os
+import json
+import shutil
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+from src.end_to_end_ds import logger
+from src.end_to_end_ds.entity.config_entity import BatchPredictionConfig
+from src.end_to_end_ds.pipeline.prediction import PredictionPipeline
+from src.end_to_end_ds.utils.common import create_directories, read_csv_with_schema, normalize_column_name, schema_dtypes
+
+
+OUTPUT_SUFFIXES = {
+    "csv"     : ".csv",
+    "gzip"    : ".csv.gz",
+    "parquet" : ".parquet",
+}
+
+
+class BatchPrediction:
+    def __init__(self, config: BatchPredictionConfig):
+        self.config = config
+        self.executor = ThreadPoolExecutor(max_workers=self.config.max_workers, thread_name_prefix="batch-job")
+        create_directories([self.config.root_dir], verbose=False)
+
+    def _job_dir(self, job_id: str) -> Path:
+        return Path(self.config.root_dir) / job_id
+
+    def _read_status(self, job_id: str) -> dict:
+        with open(self._job_dir(job_id) / "status.json") as f:
+            return json.load(f)
+
+    def _write_status(self, job_id: str, **fields):
+        # Written on every chunk, so skip save_json's logging and replace the file in one step
+        status_path = self._job_dir(job_id) / "status.json"
+        status = self._read_status(job_id) if status_path.exists() else {}
+        status.update(fields, job_id=job_id, updated_at=time.time())
+        tmp_path = status_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(status, f, indent=4)
+        os.replace(tmp_path, status_path)
+
+    def submit(self, input_path: Path, filename: str, output_format: str = None) -> str:
+        output_format = output_format or self.config.output_format
+        if output_format not in OUTPUT_SUFFIXES:
+            raise ValueError(f"Unsupported output format: {output_format}")
+
+        job_id = uuid.uuid4().hex
+        job_dir = self._job_dir(job_id)
+        create_directories([str(job_dir)], verbose=False)
+        job_input = job_dir / "input.csv"
+        shutil.move(str(input_path), job_input)
+
+        with open(job_input, "rb") as f:
+            total_rows = max(sum(chunk.count(b"\n") for chunk in iter(lambda: f.read(1 << 20), b"")) - 1, 0)
+
+        output_name = f"predictions_{Path(filename).stem}{OUTPUT_SUFFIXES[output_format]}"
+        self._write_status(
+            job_id,
+            filename       = filename,
+            output_name    = output_name,
+            output_format  = output_format,
+            state          = "queued",
+            total_rows     = total_rows,
+            processed_rows = 0,
+            created_at     = time.time(),
+        )
+        self.apply_retention()
+
+        self.executor.submit(self._run, job_id, job_input, job_dir / output_name, output_format)
+        logger.info(f"Batch prediction job {job_id} queued for {filename} ({total_rows} rows)")
+        return job_id
+
+    def _run(self, job_id: str, job_input: Path, output_path: Path, output_format: str):
+        writer = None
+        # Write to a temp name so a download never sees a half-written file
+        tmp_path = output_path.with_name(output_path.name + ".part")
+        try:
+            self._write_status(job_id, state="running")
+            predictor = PredictionPipeline()
+            processed = 0
+            features = None
+
+            # Every uploaded column (ids and the like) is written back next to its
+            # prediction. Only schema columns are typed; the rest are read as text,
+            # so their dtype cannot change from one chunk to the next
+            header = pd.read_csv(job_input, nrows=0).columns
+            typed = schema_dtypes(job_input)
+            passthrough = [c for c in header if c not in typed and c != "prediction"]
+            chunks = read_csv_with_schema(
+                job_input,
+                usecols   = None,
+                dtype     = {c: str for c in passthrough},
+                chunksize = self.config.chunk_size,
+            )
+            for i, chunk in enumerate(chunks):
+                if features is None:
+                    wanted = {normalize_column_name(c) for c in self.config.feature_columns}
+                    features = [c for c in chunk.columns if normalize_column_name(c) in wanted]
+                chunk["prediction"] = predictor.predict(chunk[features], populate_cache=False)
+                if output_format == "parquet":
+                    writer = self._write_parquet_chunk(writer, tmp_path, chunk, passthrough)
+                else:
+                    chunk.to_csv(
+                        tmp_path,
+                        mode        = "w" if i == 0 else "a",
+                        header      = i == 0,
+                        index       = False,
+                        compression = "gzip" if output_format == "gzip" else None,
+                    )
+                processed += len(chunk)
+                self._write_status(job_id, processed_rows=processed)
+
+            if writer is not None:
+                writer.close()
+                writer = None
+
+            os.replace(tmp_path, output_path)
+            job_input.unlink()
+            self._write_status(job_id, state="done", processed_rows=processed, total_rows=processed)
+            logger.info(f"Batch prediction job {job_id} finished: {output_path}")
+        except Exception as e:
+            logger.exception(e)
+            if writer is not None:
+                writer.close()
+            tmp_path.unlink(missing_ok=True)
+            self._write_status(job_id, state="failed", error=str(e))
+
+    @staticmethod
+    def _write_parquet_chunk(writer, path: Path, chunk: pd.DataFrame, passthrough: list):
+        # One row group per chunk, so Parquet output needs no more memory than CSV.
+        # The schema is fixed by the first chunk, with pass-through columns pinned
+        # to string and integers left nullable, so every later chunk fits it
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if writer is None:
+            schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+            for column in passthrough:
+                i = schema.get_field_index(column)
+                schema = schema.set(i, pa.field(column, pa.string()))
+            writer = pq.ParquetWriter(path, schema)
+        writer.write_table(pa.Table.from_pandas(chunk, schema=writer.schema, preserve_index=False))
+        return writer
+
+    def status(self, job_id: str) -> dict:
+        if not job_id.isalnum() or not (self._job_dir(job_id) / "status.json").exists():
+            raise KeyError(job_id)
+        status = self._read_status(job_id)
+        total = status.get("total_rows") or 0
+        status["progress"] = 1.0 if status["state"] == "done" else (status["processed_rows"] / total if total else 0.0)
+        return status
+
+    def output_path(self, job_id: str) -> Path:
+        status = self.status(job_id)
+        if status["state"] != "done":
+            raise FileNotFoundError(f"Job {job_id} is {status['state']}")
+        return self._job_dir(job_id) / status["output_name"]
+
+    def apply_retention(self):
+        root = Path(self.config.root_dir)
+        now = time.time()
+        max_age = self.config.max_age_hours * 3600
+        max_bytes = self.config.max_total_mb * 1024 * 1024
+
+        entries = []
+        for path in root.iterdir():
+            try:
+                files = [path] if path.is_file() else [p for p in path.rglob("*") if p.is_file()]
+                size = sum(p.stat().st_size for p in files)
+                mtime = max((p.stat().st_mtime for p in files), default=path.stat().st_mtime)
+            except FileNotFoundError:
+                continue
+            entries.append((mtime, size, path))
+
+        def remove(path: Path):
+            # Never pull a job out from under a live worker; a job that has not
+            # reported progress within max_age died with its process and is fair game
+            try:
+                if (path / "status.json").exists():
+                    status = self._read_status(path.name)
+                    if status["state"] in ("queued", "running") and now - status["updated_at"] <= max_age:
+                        return False
+                shutil.rmtree(path) if path.is_dir() else path.unlink()
+            except (FileNotFoundError, ValueError):
+                return False
+            logger.info(f"Retention policy removed {path}")
+            return True
+
+        kept = []
+        for mtime, size, path in sorted(entries):
+            if now - mtime > max_age and remove(path):
+                continue
+            kept.append((mtime, size, path))
+
+        total = sum(size for _, size, _ in kept)
+        for mtime, size, path in kept:
+            if total <= max_bytes:
+                break
+            if remove(path):
+                total -= size
@@ -1,8 +1,10 @@
 import os 
+import shutil
 import urllib.request as request
 import zipfile
 from src.end_to_end_ds import logger
 from src.end_to_end_ds.entity.config_entity import DataIngestionConfig
+from src.end_to_end_ds.utils.common import atomic_path, write_manifest
 
 class DataIngestion:
     def __init__(self, config: DataIngestionConfig):
@@ -10,10 +12,11 @@ class DataIngestion:
 
     def download_file(self):
         if not os.path.exists(self.config.local_data_file):
-            filename, headers = request.urlretrieve(
-                url = self.config.source_URL,
-                filename = self.config.local_data_file
-            )
+            with atomic_path(self.config.local_data_file) as tmp:
+                filename, headers = request.urlretrieve(
+                    url = self.config.source_URL,
+                    filename = tmp
+                )
             logger.info(f"{filename} download with following info: {headers}")
         
         else:
@@ -23,5 +26,18 @@ class DataIngestion:
         unzip_path = self.config.unzip_dir
         os.makedirs(unzip_path, exist_ok=True)
 
+        extracted = []
         with zipfile.ZipFile(self.config.local_data_file, 'r') as zip_file:
-            zip_file.extractall(unzip_path)
\ No newline at end of file
+            for member in zip_file.infolist():
+                if member.is_dir():
+                    continue
+                target = os.path.join(unzip_path, member.filename)
+                # extractall() sanitises member paths; refuse anything that would land outside unzip_dir
+                if os.path.commonpath([os.path.abspath(target), os.path.abspath(unzip_path)]) != os.path.abspath(unzip_path):
+                    raise ValueError(f"Refusing to extract {member.filename} outside {unzip_path}")
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                with atomic_path(target) as tmp, zip_file.open(member) as src, open(tmp, "wb") as dst:
+                    shutil.copyfileobj(src, dst, 1 << 20)
+                extracted.append(target)
+
+        write_manifest(self.config.root_dir, [self.config.local_data_file] + extracted)
\ No newline at end of file
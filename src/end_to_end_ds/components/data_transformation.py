@@ -3,6 +3,7 @@ import urllib.request as request
 import zipfile
 from src.end_to_end_ds import logger
 from src.end_to_end_ds.entity.config_entity import DataTransformationConfig
+from src.end_to_end_ds.utils.common import read_csv_with_schema, atomic_path, write_manifest
 from sklearn.model_selection import train_test_split
 import pandas as pd
 
@@ -12,12 +13,17 @@ class DataTransformation:
         self.config = config
     
     def split_data(self):
-        df = pd.read_csv(self.config.data_path)
+        df = read_csv_with_schema(self.config.data_path)
 
         train, test = train_test_split(df, random_state=self.config.random_state)
 
-        train.to_csv(os.path.join(self.config.root_dir, "train.csv"), index=False)
-        test.to_csv(os.path.join(self.config.root_dir, "test.csv"), index=False)
+        train_path = os.path.join(self.config.root_dir, "train.csv")
+        test_path = os.path.join(self.config.root_dir, "test.csv")
+        with atomic_path(train_path) as tmp:
+            train.to_csv(tmp, index=False)
+        with atomic_path(test_path) as tmp:
+            test.to_csv(tmp, index=False)
+        write_manifest(self.config.root_dir, [train_path, test_path])
         
         logger.info("Split data into train and test sets")
         logger.info(train.shape)
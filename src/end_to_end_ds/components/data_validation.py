@@ -3,6 +3,7 @@ import urllib.request as request
 import zipfile
 from src.end_to_end_ds import logger
 from src.end_to_end_ds.entity.config_entity import DataValidationConfig
+from src.end_to_end_ds.utils.common import atomic_path, write_manifest
 import pandas as pd
 
 class DataValidation:
@@ -14,20 +15,21 @@ class DataValidation:
         try:
             validation_status = False
 
-            data = pd.read_csv(self.config.unzip_data_dir)
-            all_cols = data.columns
+            # Only the header is checked here; a typed read would drop unknown columns
+            all_cols = pd.read_csv(self.config.unzip_data_dir, nrows=0).columns
 
             all_schema = self.config.all_schema.keys()
 
             for col in all_cols:
                 if not col in all_schema:
                     validation_status= False
-                    with open(self.config.STATUS_FILE, "w") as file:
-                        file.write(f"Validation Status: {validation_status}")
                 else:
                     validation_status = True
-                    with open(self.config.STATUS_FILE, "w") as file:
-                        file.write(f"Validation Status: {validation_status}")
+
+            with atomic_path(self.config.STATUS_FILE) as tmp:
+                with open(tmp, "w") as file:
+                    file.write(f"Validation Status: {validation_status}")
+            write_manifest(self.config.root_dir, [self.config.STATUS_FILE])
 
             return validation_status
         
@@ -0,0 +1,40 @@
+import numpy as np
+from sklearn.ensemble import HistGradientBoostingRegressor, RandomForestRegressor
+from sklearn.linear_model import ElasticNet, Ridge
+from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
+
+
+# Backend name in params.yaml -> estimator class. Each backend's section in
+# params.yaml is passed to the constructor as-is.
+MODEL_BACKENDS = {
+    "ElasticNet"           : ElasticNet,
+    "Ridge"                : Ridge,
+    "HistGradientBoosting" : HistGradientBoostingRegressor,
+    "RandomForest"         : RandomForestRegressor,
+}
+
+
+def build_model(backend: str, params: dict):
+    if backend not in MODEL_BACKENDS:
+        raise ValueError(f"Unknown model backend {backend}, expected one of {list(MODEL_BACKENDS)}")
+    return MODEL_BACKENDS[backend](**dict(params or {}))
+
+
+def backend_name(model) -> str:
+    # The backend a trained model was built with, whatever params.yaml says now
+    for name, estimator in MODEL_BACKENDS.items():
+        if type(model) is estimator:
+            return name
+    return type(model).__name__
+
+
+def registered_model_name(backend: str) -> str:
+    return f"{backend}WineQuality"
+
+
+def eval_metrics(actual, pred):
+    rmse = np.sqrt(mean_squared_error(actual, pred))
+    mae  = mean_absolute_error(actual, pred)
+    r2   = r2_score(actual, pred)
+
+    return rmse, mae, r2
@@ -0,0 +1,81 @@
+import time
+from pathlib import Path
+
+import numpy as np
+from joblib import Parallel, delayed
+from src.end_to_end_ds import logger
+from src.end_to_end_ds.components.model_backends import build_model, eval_metrics
+from src.end_to_end_ds.entity.config_entity import ModelComparisonConfig
+from src.end_to_end_ds.utils.common import save_json, read_csv_with_schema
+
+
+# Single-row predictions timed per backend, the shape of /predict traffic
+LATENCY_SAMPLES = 200
+
+
+def _run_backend(backend: str, params: dict, train_X, train_y, test_X, test_y) -> dict:
+    model = build_model(backend, params)
+
+    start = time.perf_counter()
+    model.fit(train_X, train_y)
+    fit_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    predicted = model.predict(test_X)
+    batch_seconds = time.perf_counter() - start
+
+    latencies = []
+    for i in range(min(LATENCY_SAMPLES, len(test_X))):
+        row = test_X.iloc[[i]]
+        start = time.perf_counter()
+        model.predict(row)
+        latencies.append(time.perf_counter() - start)
+
+    rmse, mae, r2 = eval_metrics(test_y, predicted)
+
+    return {
+        "backend"           : backend,
+        "params"            : params,
+        "fit_seconds"       : fit_seconds,
+        "batch_predict_ms"  : batch_seconds * 1000,
+        "per_row_batch_us"  : batch_seconds / len(test_X) * 1e6,
+        "single_row_p50_ms" : float(np.percentile(latencies, 50) * 1000),
+        "single_row_p95_ms" : float(np.percentile(latencies, 95) * 1000),
+        "rmse"              : float(rmse),
+        "mae"               : float(mae),
+        "r2_score"          : float(r2),
+    }
+
+
+class ModelComparison:
+    def __init__(self, config: ModelComparisonConfig):
+        self.config = config
+
+    def compare(self) -> list:
+        train_data = read_csv_with_schema(self.config.train_data_path)
+        test_data = read_csv_with_schema(self.config.test_data_path)
+
+        train_X = train_data.drop(self.config.target_column, axis=1)
+        test_X = test_data.drop(self.config.target_column, axis=1)
+
+        train_y = train_data[self.config.target_column]
+        test_y = test_data[self.config.target_column]
+
+        # One process per backend; joblib caps each one's inner threads so
+        # RandomForest's n_jobs does not oversubscribe the host
+        results = Parallel(n_jobs=self.config.n_jobs)(
+            delayed(_run_backend)(
+                backend, dict(self.config.all_params.get(backend, {})), train_X, train_y, test_X, test_y
+            )
+            for backend in self.config.backends
+        )
+
+        save_json(path=Path(self.config.report_file), data={"train_rows": len(train_data), "test_rows": len(test_data), "results": results})
+
+        for r in sorted(results, key=lambda r: r["rmse"]):
+            logger.info(
+                f"{r['backend']:<22} rmse={r['rmse']:.4f} r2={r['r2_score']:.4f} "
+                f"fit={r['fit_seconds']:.2f}s p50={r['single_row_p50_ms']:.2f}ms"
+            )
+
+        return results
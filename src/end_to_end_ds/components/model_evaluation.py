@@ -5,12 +5,12 @@ import joblib
 import dagshub
 import os
 from dotenv import load_dotenv
-from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
 from urllib.parse import urlparse
 import mlflow
 import mlflow.sklearn
 import numpy as np
-from src.end_to_end_ds.utils.common import save_json
+from src.end_to_end_ds.utils.common import save_json, read_csv_with_schema, write_manifest
+from src.end_to_end_ds.components.model_backends import eval_metrics, registered_model_name, backend_name
 from pathlib import Path
 
 class ModelEvaluation:
@@ -18,11 +18,7 @@ class ModelEvaluation:
         self.config = config 
     
     def eval_metrics(self, actual, pred):
-        rmse = np.sqrt(mean_squared_error(actual, pred))
-        mae  = mean_absolute_error(actual, pred)
-        r2   = r2_score(actual, pred)
-
-        return rmse, mae, r2
+        return eval_metrics(actual, pred)
     
     def log_to_mlflow(self):
         try:
@@ -41,8 +37,10 @@ class ModelEvaluation:
         except Exception as e:
             logger.warning(f"DagHub initialization failed: {e}. Continuing with local MLflow...")
 
-        test_data = pd.read_csv(self.config.test_data_path)
+        test_data = read_csv_with_schema(self.config.test_data_path)
         model = joblib.load(self.config.model_path)
+        # Describe the model that was trained, which may predate a params.yaml edit
+        backend = backend_name(model)
 
         test_x = test_data.drop(self.config.target_column, axis=1)
         test_y = test_data[[self.config.target_column]]
@@ -61,8 +59,10 @@ class ModelEvaluation:
             }
 
             save_json(path=Path(self.config.metric_file_name), data=scores)
+            write_manifest(self.config.root_dir, [self.config.metric_file_name])
 
-            mlflow.log_params(self.config.all_params)
+            mlflow.log_param("backend", backend)
+            mlflow.log_params(model.get_params())
             mlflow.log_metric("rmse", rmse)
             mlflow.log_metric("mae", mae)
             mlflow.log_metric("r2_score", r2)
@@ -74,7 +74,7 @@ class ModelEvaluation:
                     mlflow.sklearn.log_model(
                         sk_model=model, 
                         artifact_path="model",
-                        registered_model_name="ElasticNetWineQuality"
+                        registered_model_name=registered_model_name(backend)
                     )
                 else:
                     mlflow.sklearn.log_model(sk_model=model, artifact_path="model")
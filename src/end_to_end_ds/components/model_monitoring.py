@@ -0,0 +1,291 @@
+import os
+import fcntl
+import json
+import shutil
+import socket
+import threading
+import time
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from src.end_to_end_ds import logger
+from src.end_to_end_ds.entity.config_entity import ModelMonitoringConfig
+from src.end_to_end_ds.utils.common import save_json, load_json, normalize_column_name, read_csv_with_schema, write_manifest, atomic_path, create_directories
+
+
+# Keeps empty bins from blowing PSI up to infinity
+EPSILON = 1e-6
+
+# Sketches of worker processes that have exited are folded into this file
+AGGREGATE_FILE = "aggregate.json"
+
+
+class FeatureSketch:
+    # Streaming summary of one feature: counts over the reference bins plus a
+    # Welford mean/variance, so memory stays fixed however much traffic arrives
+    def __init__(self, edges: np.ndarray):
+        self.edges = edges
+        self.counts = np.zeros(len(edges) + 1, dtype=np.int64)
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.missing = 0
+
+    def update(self, values: np.ndarray):
+        nan_mask = np.isnan(values)
+        self.missing += int(nan_mask.sum())
+        values = values[~nan_mask]
+        if not len(values):
+            return
+
+        self.counts += np.bincount(np.searchsorted(self.edges, values, side="right"), minlength=len(self.counts))
+
+        batch_mean = float(values.mean())
+        self._combine(len(values), batch_mean, float(((values - batch_mean) ** 2).sum()))
+
+    def _combine(self, n: int, mean: float, m2: float):
+        # Chan et al. parallel update of mean / M2 with another set's statistics
+        if not n:
+            return
+        delta = mean - self.mean
+        total = self.n + n
+        self.mean += delta * n / total
+        self.m2 += m2 + delta ** 2 * self.n * n / total
+        self.n = total
+
+    def merge(self, state: dict):
+        # Folds in another process's sketch, as written by to_dict()
+        self.counts += np.asarray(state["counts"], dtype=np.int64)
+        self.missing += state["missing"]
+        self._combine(state["n"], state["mean"], state["m2"])
+
+    def to_dict(self) -> dict:
+        return {"counts": self.counts.tolist(), "n": self.n, "mean": self.mean, "m2": self.m2, "missing": self.missing}
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+
+class ModelMonitoring:
+    def __init__(self, config: ModelMonitoringConfig):
+        self.config = config
+        self.reference = None
+        self.reference_version = None
+        self.sketches = {}
+        self._lock = threading.Lock()
+        self._pid = None
+        self._sketch_file = None
+        self._last_flush = 0.0
+
+    def build_reference(self):
+        train_data = read_csv_with_schema(self.config.train_data_path)
+        by_name = {normalize_column_name(c): c for c in train_data.columns}
+
+        features = {}
+        for feature in self.config.feature_columns:
+            column = by_name.get(normalize_column_name(feature))
+            if column is None:
+                logger.warning(f"Feature {feature} not found in {self.config.train_data_path}, skipping")
+                continue
+
+            values = train_data[column].dropna().to_numpy(dtype=np.float64)
+            quantiles = np.linspace(0, 1, self.config.n_bins + 1)[1:-1]
+            edges = np.unique(np.quantile(values, quantiles))
+            counts = np.bincount(np.searchsorted(edges, values, side="right"), minlength=len(edges) + 1)
+
+            features[normalize_column_name(feature)] = {
+                "column"      : column,
+                "edges"       : edges.tolist(),
+                "proportions" : (counts / counts.sum()).tolist(),
+                "count"       : int(len(values)),
+                "mean"        : float(values.mean()),
+                "variance"    : float(values.var(ddof=1)),
+            }
+
+        save_json(path=Path(self.config.reference_file), data={"n_bins": self.config.n_bins, "features": features})
+        write_manifest(self.config.root_dir, [self.config.reference_file])
+
+        # Sketches flushed against the previous profile no longer apply
+        shutil.rmtree(self.config.sketch_dir, ignore_errors=True)
+        create_directories([self.config.sketch_dir], verbose=False)
+        logger.info(f"Reference profile built for {len(features)} features")
+
+    def _ensure_reference(self) -> bool:
+        # Reload (and restart the live sketches) whenever training writes a new profile,
+        # and in a freshly forked worker, whose inherited counts belong to its parent
+        if not os.path.exists(self.config.reference_file):
+            return False
+        stat = os.stat(self.config.reference_file)
+        version = f"{stat.st_mtime_ns}-{stat.st_size}"
+        if version != self.reference_version or os.getpid() != self._pid:
+            self.reference = load_json(Path(self.config.reference_file))
+            self.sketches = {
+                name: FeatureSketch(np.asarray(feature.edges, dtype=np.float64))
+                for name, feature in self.reference.features.items()
+            }
+            self.reference_version = version
+            self._pid = os.getpid()
+            self._sketch_file = Path(self.config.sketch_dir) / f"{socket.gethostname()}-{self._pid}-{uuid.uuid4().hex}.json"
+            self._last_flush = 0.0
+        return True
+
+    def _flush(self):
+        # Each process owns one file under sketch_dir; report() merges them all, so
+        # every worker's traffic counts no matter which worker answers the request
+        state = {
+            "reference_version" : self.reference_version,
+            "features"          : {name: sketch.to_dict() for name, sketch in self.sketches.items()},
+        }
+        os.makedirs(self._sketch_file.parent, exist_ok=True)
+        with atomic_path(self._sketch_file) as tmp:
+            with open(tmp, "w") as f:
+                json.dump(state, f)
+        self._last_flush = time.monotonic()
+
+    def flush(self):
+        with self._lock:
+            if self._sketch_file is not None and os.getpid() == self._pid:
+                self._flush()
+
+    def _empty_sketches(self) -> dict:
+        return {
+            name: FeatureSketch(np.asarray(feature.edges, dtype=np.float64))
+            for name, feature in self.reference.features.items()
+        }
+
+    def _read_state(self, path: Path):
+        # A sketch file written against the current reference profile, else None
+        try:
+            with open(path) as f:
+                state = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        return state if state.get("reference_version") == self.reference_version else None
+
+    @staticmethod
+    def _merge_state(sketches: dict, state: dict):
+        for name, sketch in state["features"].items():
+            if name in sketches:
+                sketches[name].merge(sketch)
+
+    @staticmethod
+    def _is_dead(path: Path) -> bool:
+        # Only processes on this host can be checked; anything else counts as alive
+        try:
+            host, pid, _ = path.stem.rsplit("-", 2)
+            if host != socket.gethostname():
+                return False
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            return True
+        except (ValueError, PermissionError):
+            return False
+        return False
+
+    def _merged_sketches(self) -> dict:
+        # Files of exited workers are folded into AGGREGATE_FILE and removed, so
+        # restarts and worker recycling don't make sketch_dir (and the cost of a
+        # report) grow. The flock keeps two reporting processes from folding the
+        # same file twice; "folded" makes a crash between the aggregate write and
+        # the unlinks harmless
+        sketch_dir = Path(self.config.sketch_dir)
+        merged = self._empty_sketches()
+        aggregate = self._empty_sketches()
+
+        with open(sketch_dir / ".lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+
+            already_folded = set()
+            previous = self._read_state(sketch_dir / AGGREGATE_FILE)
+            if previous is not None:
+                self._merge_state(aggregate, previous)
+                already_folded = set(previous.get("folded", []))
+
+            folded = []
+            for path in sketch_dir.glob("*.json"):
+                if path.name == AGGREGATE_FILE:
+                    continue
+                if path.name in already_folded:
+                    path.unlink(missing_ok=True)
+                    continue
+                state = self._read_state(path)
+                if state is None:
+                    continue
+                if self._is_dead(path):
+                    self._merge_state(aggregate, state)
+                    folded.append(path)
+                else:
+                    self._merge_state(merged, state)
+
+            if folded:
+                state = {
+                    "reference_version" : self.reference_version,
+                    "folded"            : [path.name for path in folded],
+                    "features"          : {name: sketch.to_dict() for name, sketch in aggregate.items()},
+                }
+                with atomic_path(sketch_dir / AGGREGATE_FILE) as tmp:
+                    with open(tmp, "w") as f:
+                        json.dump(state, f)
+                for path in folded:
+                    path.unlink(missing_ok=True)
+
+        for name, sketch in aggregate.items():
+            merged[name].merge(sketch.to_dict())
+        return merged
+
+    def update(self, data: pd.DataFrame):
+        with self._lock:
+            if not self._ensure_reference():
+                return
+            try:
+                values = data.to_numpy(dtype=np.float64)
+            except ValueError:
+                values = data.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64)
+            for i, column in enumerate(data.columns):
+                sketch = self.sketches.get(normalize_column_name(column))
+                if sketch is not None:
+                    sketch.update(values[:, i])
+            if time.monotonic() - self._last_flush >= self.config.flush_seconds:
+                self._flush()
+
+    def report(self) -> dict:
+        with self._lock:
+            if not self._ensure_reference():
+                return {}
+            self._flush()
+
+            features = {}
+            for name, sketch in self._merged_sketches().items():
+                feature = self.reference.features[name]
+                if not sketch.n:
+                    features[feature.column] = {"observations": 0, "missing": sketch.missing}
+                    continue
+
+                expected = np.asarray(feature.proportions) + EPSILON
+                actual = sketch.counts / sketch.n + EPSILON
+                psi = float(((actual - expected) * np.log(actual / expected)).sum())
+                # KS on the binned CDFs: a lower bound on the exact statistic
+                ks = float(np.abs(np.cumsum(actual) - np.cumsum(expected)).max())
+
+                if psi >= self.config.psi_alert:
+                    status = "drift"
+                elif psi >= self.config.psi_warn:
+                    status = "warn"
+                else:
+                    status = "ok"
+
+                features[feature.column] = {
+                    "observations"       : sketch.n,
+                    "missing"            : sketch.missing,
+                    "psi"                : psi,
+                    "ks"                 : ks,
+                    "mean"               : sketch.mean,
+                    "reference_mean"     : feature.mean,
+                    "variance"           : sketch.variance,
+                    "reference_variance" : feature.variance,
+                    "status"             : status,
+                }
+            return features
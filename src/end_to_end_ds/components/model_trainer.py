@@ -4,7 +4,8 @@ import zipfile
 from src.end_to_end_ds import logger
 from src.end_to_end_ds.entity.config_entity import ModelTrainerConfig
 import pandas as pd
-from sklearn.linear_model import ElasticNet
+from src.end_to_end_ds.components.model_backends import build_model
+from src.end_to_end_ds.utils.common import read_csv_with_schema, atomic_path, write_manifest
 import joblib
 import dagshub
 from dotenv import load_dotenv
@@ -16,8 +17,8 @@ class ModelTrainer:
         self.config = config
 
     def train(self):
-        train_data = pd.read_csv(self.config.train_data_path)
-        test_data = pd.read_csv(self.config.test_data_path)
+        train_data = read_csv_with_schema(self.config.train_data_path)
+        test_data = read_csv_with_schema(self.config.test_data_path)
 
         train_X = train_data.drop(self.config.target_column, axis=1)
         test_X = test_data.drop(self.config.target_column, axis=1)
@@ -25,10 +26,16 @@ class ModelTrainer:
         train_y = train_data[self.config.target_column]
         test_y = test_data[self.config.target_column]
 
-        model = ElasticNet(alpha=self.config.alpha, l1_ratio=self.config.l1_ratio)
+        model = build_model(self.config.backend, self.config.model_params)
         model.fit(train_X, train_y)
-
-        joblib.dump(model, os.path.join(self.config.root_dir, self.config.model_name))
+        logger.info(f"Trained {self.config.backend} model with params {dict(self.config.model_params)}")
+
+        # Uncompressed dumps keep the numpy arrays page-aligned so serving can
+        # mmap them; the rename keeps workers that already mapped the old file intact
+        model_path = os.path.join(self.config.root_dir, self.config.model_name)
+        with atomic_path(model_path) as tmp:
+            joblib.dump(model, tmp, compress=self.config.compress)
+        write_manifest(self.config.root_dir, [model_path])
 
         
 
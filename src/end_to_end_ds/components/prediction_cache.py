@@ -0,0 +1,95 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from src.end_to_end_ds import logger
+from src.end_to_end_ds.entity.config_entity import PredictionCacheConfig
+from src.end_to_end_ds.utils.common import normalize_column_name
+
+
+# Bounded LRU + TTL cache of predictions keyed by (model version, feature vector)
+class PredictionCache:
+    def __init__(self, config: PredictionCacheConfig):
+        self.config = config
+        self.model_version: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def bind_model(self, model_version: str):
+        # A different model makes every stored prediction stale, so drop them all
+        with self._lock:
+            if model_version != self.model_version:
+                if self.model_version is not None:
+                    logger.info(f"Model changed ({self.model_version} -> {model_version}), clearing prediction cache")
+                self._entries.clear()
+                self.model_version = model_version
+
+    def _schema_ordered(self, data: pd.DataFrame) -> pd.DataFrame:
+        by_name = {normalize_column_name(c): c for c in data.columns}
+        order = [normalize_column_name(c) for c in self.config.feature_columns]
+        if len(by_name) == len(order) and all(c in by_name for c in order):
+            return data[[by_name[c] for c in order]]
+        return data[sorted(data.columns)]
+
+    def make_keys(self, data: pd.DataFrame) -> List[bytes]:
+        # The key is the row's raw float64 bytes, taken for the whole frame at once
+        # through a void view; adding 0.0 folds -0.0 into 0.0 so equal vectors match.
+        # The model version is not part of the key: bind_model clears the entries
+        # and put_many refuses scores from any other version
+        rows = np.ascontiguousarray(self._schema_ordered(data).to_numpy(dtype=np.float64) + 0.0)
+        return rows.view(np.dtype((np.void, rows.dtype.itemsize * rows.shape[1]))).ravel().tolist()
+
+    def get_many(self, keys: List[bytes], touch: bool = True) -> Dict[int, float]:
+        # One C-level pass finds the candidates; expiry and LRU bookkeeping then
+        # only run for rows that are actually cached. touch=False leaves the LRU
+        # order alone, so bulk lookups do not decide what the cache keeps
+        found = {}
+        now = time.monotonic()
+        with self._lock:
+            entries = list(map(self._entries.get, keys)) if self._entries else []
+            for i in [i for i, entry in enumerate(entries) if entry is not None]:
+                value, expires_at = entries[i]
+                if expires_at < now:
+                    self._entries.pop(keys[i], None)
+                    continue
+                if touch:
+                    self._entries.move_to_end(keys[i])
+                found[i] = value
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, keys: List[bytes], values, model_version: str):
+        expires_at = time.monotonic() + self.config.ttl_seconds
+        with self._lock:
+            if model_version != self.model_version:
+                return
+            for key, value in zip(keys, values):
+                self._entries[key] = (value, expires_at)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.config.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "model_version" : self.model_version,
+                "entries"       : len(self._entries),
+                "max_entries"   : self.config.max_entries,
+                "ttl_seconds"   : self.config.ttl_seconds,
+                "hits"          : self.hits,
+                "misses"        : self.misses,
+                "hit_rate"      : self.hits / lookups if lookups else 0.0,
+            }
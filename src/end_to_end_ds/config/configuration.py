@@ -1,6 +1,6 @@
 from src.end_to_end_ds.constants import *
 from src.end_to_end_ds.utils.common import read_yaml, create_directories
-from src.end_to_end_ds.entity.config_entity import DataIngestionConfig, DataValidationConfig, DataTransformationConfig, ModelTrainerConfig, ModelEvaluationConfig
+from src.end_to_end_ds.entity.config_entity import DataIngestionConfig, SyntheticDataConfig, DataValidationConfig, DataTransformationConfig, ModelTrainerConfig, ModelEvaluationConfig, ModelComparisonConfig, PredictionConfig, PredictionCacheConfig, BatchPredictionConfig, ModelMonitoringConfig
 from dotenv import load_dotenv 
 import os 
 
@@ -30,6 +30,24 @@ class ConfigurationManager:
 
         return data_ingestion_config
     
+    def get_synthetic_data_config(self) -> SyntheticDataConfig:
+        config = self.config.synthetic_data
+
+        create_directories([config.root_dir])
+
+        synthetic_data_config = SyntheticDataConfig(
+            root_dir       = config.root_dir,
+            rows           = config.rows,
+            chunk_size     = config.chunk_size,
+            random_state   = config.random_state,
+            data_file_name = config.data_file_name,
+            zip_file       = config.zip_file,
+            all_schema     = self.schema.COLUMNS,
+            target_column  = self.schema.TARGET_COLUMN.name
+        )
+
+        return synthetic_data_config
+    
     def get_data_validation_config(self) -> DataValidationConfig:
         config = self.config.data_validation
         schema = self.schema.COLUMNS
@@ -62,7 +80,7 @@ class ConfigurationManager:
     
     def get_model_trainer_config(self) -> ModelTrainerConfig:
         config = self.config.model_trainer
-        params = self.params.ElasticNet
+        backend = self.params.model.backend
         schema = self.schema.TARGET_COLUMN
 
         create_directories([config.root_dir])
@@ -72,8 +90,9 @@ class ConfigurationManager:
             train_data_path = config.train_data_path,
             test_data_path  = config.test_data_path,
             model_name      = config.model_name,
-            alpha           = params.alpha,
-            l1_ratio        = params.l1_ratio,
+            compress        = config.compress,
+            backend         = backend,
+            model_params    = self.params.get(backend, {}),
             target_column   = schema.name,
         )
 
@@ -97,6 +116,83 @@ class ConfigurationManager:
             all_params       = params
         )
 
-        return model_evaluation_config 
+        return model_evaluation_config
+
+    def get_model_comparison_config(self) -> ModelComparisonConfig:
+        config = self.config.model_comparison
+        schema = self.schema.TARGET_COLUMN
+
+        create_directories([config.root_dir])
 
+        model_comparison_config = ModelComparisonConfig(
+            root_dir        = config.root_dir,
+            train_data_path = config.train_data_path,
+            test_data_path  = config.test_data_path,
+            report_file     = config.report_file,
+            target_column   = schema.name,
+            backends        = list(self.params.model.compare),
+            all_params      = self.params,
+            n_jobs          = config.n_jobs
+        )
+
+        return model_comparison_config
+
+    def get_prediction_config(self) -> PredictionConfig:
+        config = self.config.prediction
+
+        prediction_config = PredictionConfig(
+            model_path = config.model_path,
+            mmap_mode  = config.mmap_mode
+        )
+
+        return prediction_config
+
+    def get_prediction_cache_config(self) -> PredictionCacheConfig:
+        config = self.config.prediction_cache
+        target = self.schema.TARGET_COLUMN.name
+
+        prediction_cache_config = PredictionCacheConfig(
+            max_entries     = config.max_entries,
+            ttl_seconds     = config.ttl_seconds,
+            feature_columns = [c for c in self.schema.COLUMNS.keys() if c != target]
+        )
+
+        return prediction_cache_config
+
+    def get_batch_prediction_config(self) -> BatchPredictionConfig:
+        config = self.config.batch_prediction
+        target = self.schema.TARGET_COLUMN.name
+
+        create_directories([config.root_dir])
+
+        batch_prediction_config = BatchPredictionConfig(
+            root_dir        = config.root_dir,
+            max_workers     = config.max_workers,
+            chunk_size      = config.chunk_size,
+            output_format   = config.output_format,
+            max_age_hours   = config.max_age_hours,
+            max_total_mb    = config.max_total_mb,
+            feature_columns = [c for c in self.schema.COLUMNS.keys() if c != target]
+        )
+
+        return batch_prediction_config
+
+    def get_model_monitoring_config(self) -> ModelMonitoringConfig:
+        config = self.config.model_monitoring
+        target = self.schema.TARGET_COLUMN.name
+
+        create_directories([config.root_dir, config.sketch_dir])
+
+        model_monitoring_config = ModelMonitoringConfig(
+            root_dir        = config.root_dir,
+            train_data_path = config.train_data_path,
+            reference_file  = config.reference_file,
+            sketch_dir      = config.sketch_dir,
+            flush_seconds   = config.flush_seconds,
+            n_bins          = config.n_bins,
+            psi_warn        = config.psi_warn,
+            psi_alert       = config.psi_alert,
+            feature_columns = [c for c in self.schema.COLUMNS.keys() if c != target]
+        )
 
+        return model_monitoring_config
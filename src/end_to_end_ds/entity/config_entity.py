@@ -8,6 +8,17 @@ class DataIngestionConfig:
     local_data_file: Path
     unzip_dir: Path
 
+@dataclass
+class SyntheticDataConfig:
+    root_dir: Path
+    rows: int
+    chunk_size: int
+    random_state: int
+    data_file_name: str
+    zip_file: Path
+    all_schema: dict
+    target_column: str
+
 @dataclass
 class DataValidationConfig:
     root_dir: Path
@@ -28,8 +39,9 @@ class ModelTrainerConfig:
     train_data_path: Path
     test_data_path: Path
     model_name: str
-    alpha: float
-    l1_ratio: float
+    compress: int
+    backend: str
+    model_params: dict
     target_column: str
 
 @dataclass
@@ -40,5 +52,48 @@ class ModelEvaluationConfig:
     metric_file_name: Path
     target_column: str
     mlflow_url: str
-    all_params: dict 
-     
\ No newline at end of file
+    all_params: dict
+
+@dataclass
+class ModelComparisonConfig:
+    root_dir: Path
+    train_data_path: Path
+    test_data_path: Path
+    report_file: Path
+    target_column: str
+    backends: list
+    all_params: dict
+    n_jobs: int
+
+@dataclass
+class PredictionConfig:
+    model_path: Path
+    mmap_mode: str
+
+@dataclass
+class PredictionCacheConfig:
+    max_entries: int
+    ttl_seconds: float
+    feature_columns: list
+
+@dataclass
+class BatchPredictionConfig:
+    root_dir: Path
+    max_workers: int
+    chunk_size: int
+    output_format: str
+    max_age_hours: float
+    max_total_mb: float
+    feature_columns: list
+
+@dataclass
+class ModelMonitoringConfig:
+    root_dir: Path
+    train_data_path: Path
+    reference_file: Path
+    sketch_dir: Path
+    flush_seconds: float
+    n_bins: int
+    psi_warn: float
+    psi_alert: float
+    feature_columns: list
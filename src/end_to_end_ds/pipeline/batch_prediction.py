@@ -0,0 +1,34 @@
+import threading
+from src.end_to_end_ds.components.batch_prediction import BatchPrediction
+from src.end_to_end_ds.config.configuration import ConfigurationManager
+from src.end_to_end_ds import logger
+
+
+STAGE_NAME = "BATCH PREDICTION RETENTION STAGE"
+
+_batch_prediction = None
+_batch_prediction_lock = threading.Lock()
+
+
+def get_batch_prediction() -> BatchPrediction:
+    # One worker pool per process, shared by every request
+    global _batch_prediction
+    with _batch_prediction_lock:
+        if _batch_prediction is None:
+            config = ConfigurationManager()
+            _batch_prediction = BatchPrediction(config.get_batch_prediction_config())
+        return _batch_prediction
+
+
+def main():
+    try:
+        logger.info(f">>>>>>>>>>>>>> {STAGE_NAME} started <<<<<<<<<<<<<<")
+        get_batch_prediction().apply_retention()
+        logger.info(f">>>>>>>>>>>>>> {STAGE_NAME} completed <<<<<<<<<<<<<<")
+    except Exception as e:
+        logger.exception(e)
+        raise e 
+
+
+if __name__ == "__main__":
+    main()
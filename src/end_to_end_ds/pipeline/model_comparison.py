@@ -0,0 +1,30 @@
+from src.end_to_end_ds.components.model_comparison import ModelComparison
+from src.end_to_end_ds.config.configuration import ConfigurationManager
+from src.end_to_end_ds import logger
+
+
+STAGE_NAME = "MODEL COMPARISON STAGE"
+
+class ModelComparisonPipeline:
+    def __init__(self):
+        pass
+
+    def init_model_comparison(self):
+        config = ConfigurationManager()
+        model_comparison_config = config.get_model_comparison_config()
+        model_comparison = ModelComparison(model_comparison_config)
+        model_comparison.compare()
+
+def main():
+    try:
+        logger.info(f">>>>>>>>>>>>>> {STAGE_NAME} started <<<<<<<<<<<<<<")
+        obj = ModelComparisonPipeline()
+        obj.init_model_comparison()
+        logger.info(f">>>>>>>>>>>>>> {STAGE_NAME} completed <<<<<<<<<<<<<<")
+    except Exception as e:
+        logger.exception(e)
+        raise e 
+
+
+if __name__ == "__main__":
+    main()
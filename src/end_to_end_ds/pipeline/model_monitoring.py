@@ -0,0 +1,50 @@
+import atexit
+import threading
+from src.end_to_end_ds.components.model_monitoring import ModelMonitoring
+from src.end_to_end_ds.config.configuration import ConfigurationManager
+from src.end_to_end_ds import logger
+
+
+STAGE_NAME = "MODEL MONITORING STAGE"
+
+_monitor = None
+_monitor_lock = threading.Lock()
+
+
+def get_model_monitoring() -> ModelMonitoring:
+    # One monitor per process, shared by every request; its sketch is flushed to
+    # sketch_dir so reports merge the traffic of every worker
+    global _monitor
+    with _monitor_lock:
+        if _monitor is None:
+            config = ConfigurationManager()
+            _monitor = ModelMonitoring(config.get_model_monitoring_config())
+            # Don't lose the counts gathered since the last periodic flush
+            atexit.register(_monitor.flush)
+        return _monitor
+
+
+class ModelMonitoringPipeline:
+    def __init__(self):
+        pass
+
+    def init_model_monitoring(self):
+        config = ConfigurationManager()
+        model_monitoring_config = config.get_model_monitoring_config()
+        model_monitoring = ModelMonitoring(model_monitoring_config)
+        model_monitoring.build_reference()
+
+
+def main():
+    try:
+        logger.info(f">>>>>>>>>>>>>> {STAGE_NAME} started <<<<<<<<<<<<<<")
+        obj = ModelMonitoringPipeline()
+        obj.init_model_monitoring()
+        logger.info(f">>>>>>>>>>>>>> {STAGE_NAME} completed <<<<<<<<<<<<<<")
+    except Exception as e:
+        logger.exception(e)
+        raise e 
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 from src.end_to_end_ds.components.model_trainer import ModelTrainer
 from src.end_to_end_ds.config.configuration import ConfigurationManager
+from src.end_to_end_ds.pipeline.model_monitoring import ModelMonitoringPipeline
 from src.end_to_end_ds import logger
 
 STAGE_NAME = "MODEL TRAIN STAGE"
@@ -13,6 +14,8 @@ class ModelTrainingPipeline:
         model_trainer_config = config.get_model_trainer_config()
         model_train = ModelTrainer(model_trainer_config)
         model_train.train()
+        # Drift reference has to describe the data this model was fitted on
+        ModelMonitoringPipeline().init_model_monitoring()
 
 def main():
     try:
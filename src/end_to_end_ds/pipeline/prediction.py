@@ -1,12 +1,141 @@
+import os
+import threading
 import joblib 
 import pandas as pd
 import numpy as np
 from pathlib import Path
+from src.end_to_end_ds import logger
+from src.end_to_end_ds.components.prediction_cache import PredictionCache
+from src.end_to_end_ds.config.configuration import ConfigurationManager
+from src.end_to_end_ds.entity.config_entity import PredictionConfig
+from src.end_to_end_ds.pipeline.model_monitoring import get_model_monitoring
+from src.end_to_end_ds.utils.common import read_snapshot
+
+
+_config = None
+_cache = None
+_model = None
+_model_version = None
+_lock = threading.Lock()
+
+
+def _get_prediction_config() -> PredictionConfig:
+    global _config
+    with _lock:
+        if _config is None:
+            _config = ConfigurationManager().get_prediction_config()
+        return _config
+
+
+def get_prediction_cache() -> PredictionCache:
+    global _cache
+    with _lock:
+        if _cache is None:
+            config = ConfigurationManager()
+            _cache = PredictionCache(config.get_prediction_cache_config())
+        return _cache
+
+
+# How many times a load is retried when a retrain replaces the model mid-read
+LOAD_ATTEMPTS = 5
+
+
+def _model_version_on_disk(model_path: Path) -> str:
+    # The trainer's manifest gives the model's hash; while a retrain sits between
+    # replacing model.joblib and rewriting the manifest (or for models trained
+    # before manifests existed) fall back to the file's mtime and size
+    snapshot = read_snapshot(model_path.parent)
+    if snapshot is not None and model_path.name in snapshot.files:
+        return snapshot.files[model_path.name].sha256
+    stat = os.stat(model_path)
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+def current_model_version() -> str:
+    return _model_version_on_disk(Path(_get_prediction_config().model_path))
+
+
+def _load_model(model_version: str):
+    # One copy per process per model version. With mmap_mode="r" the numeric
+    # arrays are read-only mappings of model.joblib, so every worker on the
+    # host shares the same page-cache pages instead of holding its own copy
+    global _model, _model_version
+    config = _get_prediction_config()
+    with _lock:
+        if _model_version == model_version:
+            return _model, _model_version
+
+        # joblib reopens the file for every mmapped array, so a rename landing
+        # mid-load could mix two models; keep the load only if the version on
+        # disk is the same before and after it
+        for _ in range(LOAD_ATTEMPTS):
+            model = joblib.load(Path(config.model_path), mmap_mode=config.mmap_mode or None)
+            loaded_version = _model_version_on_disk(Path(config.model_path))
+            if loaded_version == model_version:
+                break
+            model_version = loaded_version
+        else:
+            raise RuntimeError(f"{config.model_path} kept changing while it was being loaded")
+
+        _model, _model_version = model, model_version
+        logger.info(f"Loaded model {config.model_path} (version {model_version}, mmap_mode={config.mmap_mode})")
+        return _model, _model_version
+
+
+def load_model(model_version: str):
+    return _load_model(model_version)[0]
+
+
+def preload_model():
+    # Call before forking workers (e.g. `gunicorn --preload`): children inherit the
+    # loaded model copy-on-write, which also covers estimators such as random forests
+    # whose tree nodes are copied out of the mmap on load
+    return load_model(current_model_version())
 
 
 class PredictionPipeline:
     def __init__(self):
-        self.model = joblib.load(Path("artifacts/model_trainer/model.joblib"))
+        # The version comes from the file on disk, so a retrained model
+        # invalidates the cache without anyone having to clear it
+        self.model_version = current_model_version()
+        self.cache = get_prediction_cache()
+        self.cache.bind_model(self.model_version)
+        self._model = None
+        self._loaded_version = None
+
+    @property
+    def model(self):
+        # Only load the model when some row actually misses the cache
+        if self._model is None:
+            self._model, self._loaded_version = _load_model(self.model_version)
+        return self._model
+
+    def predict(self, data: pd.DataFrame, populate_cache: bool = True):
+        # Batch jobs pass populate_cache=False: they still reuse cached scores, but
+        # one large upload must not evict the interactive working set from the LRU
+        keys = self.cache.make_keys(data)
+        cached = self.cache.get_many(keys, touch=populate_cache)
+
+        preds = np.empty(len(data), dtype=np.float64)
+        hit = np.zeros(len(data), dtype=bool)
+        if cached:
+            index = np.fromiter(cached.keys(), dtype=np.intp, count=len(cached))
+            preds[index] = np.fromiter(cached.values(), dtype=np.float64, count=len(cached))
+            hit[index] = True
+
+        missing = np.flatnonzero(~hit)
+        if len(missing):
+            scored = self.model.predict(data.iloc[missing] if len(cached) else data)
+            preds[missing] = scored
+            # Scores from a retrain that landed since __init__ are not stored under
+            # the keys of the version the cache is bound to
+            if populate_cache:
+                self.cache.put_many([keys[i] for i in missing], scored.tolist(), self._loaded_version)
+
+        # Only traffic that was actually scored counts, and monitoring never fails a prediction
+        try:
+            get_model_monitoring().update(data)
+        except Exception as e:
+            logger.exception(e)
 
-    def predict(self, data: pd.DataFrame):
-        return self.model.predict(data)
\ No newline at end of file
+        return preds
@@ -0,0 +1,30 @@
+from src.end_to_end_ds.components.synthetic_data import SyntheticDataGenerator
+from src.end_to_end_ds.config.configuration import ConfigurationManager
+from src.end_to_end_ds import logger
+
+
+STAGE_NAME = "SYNTHETIC DATA STAGE"
+
+class SyntheticDataPipeline:
+    def __init__(self):
+        pass
+
+    def init_synthetic_data(self, rows: int = None):
+        config = ConfigurationManager()
+        synthetic_data_config = config.get_synthetic_data_config()
+        synthetic_data = SyntheticDataGenerator(synthetic_data_config)
+        return synthetic_data.generate(rows)
+
+def main():
+    try:
+        logger.info(f">>>>>>>>>>>>>> {STAGE_NAME} started <<<<<<<<<<<<<<")
+        obj = SyntheticDataPipeline()
+        obj.init_synthetic_data()
+        logger.info(f">>>>>>>>>>>>>> {STAGE_NAME} completed <<<<<<<<<<<<<<")
+    except Exception as e:
+        logger.exception(e)
+        raise e 
+
+
+if __name__ == "__main__":
+    main()
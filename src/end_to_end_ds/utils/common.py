@@ -1,8 +1,15 @@
 import os 
 import yaml
 from src.end_to_end_ds import logger
+from src.end_to_end_ds.constants import SCHEME_FILE_PATH
 import json
+import time
+import hashlib
+import uuid
 import joblib
+import pandas as pd
+from contextlib import contextmanager
+from functools import lru_cache
 from ensure import ensure_annotations
 from box import ConfigBox
 from pathlib import Path
@@ -29,10 +36,84 @@ def create_directories(path_to_dirs: list, verbose=True):
         if verbose:
             logger.info(f"created directory at {path}")
 
+def _fsync_dir(directory: Path):
+    # Makes the rename itself durable; not every platform can open a directory
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def atomic_path(path):
+    # Yields a temp path next to `path`. Once the block finishes, the temp file
+    # is fsynced and renamed over `path`, so readers see the old file or the new
+    # one and never a torn write. If the block raises, `path` is untouched
+    path = Path(path)
+    tmp = path.parent / f".{path.name}.{uuid.uuid4().hex}.tmp"
+    try:
+        yield tmp
+        with open(tmp, "rb+") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    _fsync_dir(path.parent)
+
+
+def file_sha256(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def write_manifest(root_dir, files: list) -> dict:
+    # Written after the stage's own outputs: a manifest only ever describes
+    # files that are already complete on disk
+    root_dir = Path(root_dir)
+    entries = {}
+    for file in files:
+        stat = os.stat(file)
+        entries[os.path.relpath(file, root_dir)] = {
+            "size"     : stat.st_size,
+            "mtime_ns" : stat.st_mtime_ns,
+            "sha256"   : file_sha256(file),
+        }
+    manifest = {"stage": root_dir.name, "created_at": time.time(), "files": entries}
+    save_json(path=root_dir / "manifest.json", data=manifest)
+    return manifest
+
+
+def read_snapshot(root_dir):
+    # Returns the stage manifest if every file it lists is still the one it
+    # describes, else None. Only stats the files, so it is cheap enough for the
+    # serving path; a None means a writer is mid-update and the caller retries
+    manifest_path = Path(root_dir) / "manifest.json"
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        for name, entry in manifest["files"].items():
+            stat = os.stat(Path(root_dir) / name)
+            if stat.st_size != entry["size"] or stat.st_mtime_ns != entry["mtime_ns"]:
+                return None
+    except (FileNotFoundError, ValueError):
+        return None
+    return ConfigBox(manifest)
+
+
 @ensure_annotations
 def save_json(path: Path, data: dict):
-    with open(path, "w") as f:
-        json.dump(data, f, indent=4)
+    with atomic_path(path) as tmp:
+        with open(tmp, "w") as f:
+            json.dump(data, f, indent=4)
     
     logger.info(f"json file saved at: {path}")
 
@@ -47,8 +128,80 @@ def load_json(path: Path) -> ConfigBox:
 
 @ensure_annotations
 def save_bin(data: Any, path: Path):
-    data = joblib.dump(value=data, filename=path)
+    with atomic_path(path) as tmp:
+        data = joblib.dump(value=data, filename=tmp)
     logger.info(f"Binary file saved at: {path}")
 
     return data
 
+
+def normalize_column_name(column: str) -> str:
+    # The raw CSV uses spaces ("fixed acidity") where schema.yaml mostly uses underscores
+    return column.strip().lower().replace("_", " ")
+
+
+@lru_cache(maxsize=None)
+def _load_schema(schema_path: Path) -> ConfigBox:
+    return read_yaml(Path(schema_path))
+
+
+def schema_dtypes(path, schema_path: Path = SCHEME_FILE_PATH, float32: bool = False) -> dict:
+    # Map the CSV's own header names to the dtypes declared in schema.yaml COLUMNS;
+    # columns the schema does not know about are left out (and so not read)
+    schema = _load_schema(schema_path)
+    header = pd.read_csv(path, nrows=0).columns
+    by_name = {normalize_column_name(c): c for c in header}
+
+    dtype = {}
+    for name, kind in schema.COLUMNS.items():
+        column = by_name.get(normalize_column_name(name))
+        if column is not None:
+            dtype[column] = "float32" if float32 and kind.startswith("float") else kind
+    return dtype
+
+
+def _coerce_to_schema(data: pd.DataFrame, dtype: dict, bad_rows: str, source) -> pd.DataFrame:
+    bad = pd.Series(False, index=data.index)
+    for column, kind in dtype.items():
+        coerced = pd.to_numeric(data[column], errors="coerce")
+        bad |= coerced.isna() & data[column].notna()
+        if kind.startswith("int"):
+            # 6.5 in an int column is as wrong as "abc"; astype would silently truncate it
+            fractional = coerced.notna() & (coerced % 1 != 0)
+            bad |= fractional
+            coerced = coerced.mask(fractional)
+        data[column] = coerced
+
+    if bad.any():
+        if bad_rows == "raise":
+            raise ValueError(f"{int(bad.sum())} rows in {source} have values that do not match schema.yaml")
+        logger.warning(f"{int(bad.sum())} rows in {source} do not match schema.yaml, bad_rows={bad_rows}")
+        if bad_rows == "drop":
+            data = data[~bad]
+
+    # Integer columns can only take their dtype once no NaN is left in them
+    castable = {c: t for c, t in dtype.items() if not (t.startswith("int") and data[c].isna().any())}
+    return data.astype(castable)
+
+
+def read_csv_with_schema(path, schema_path: Path = SCHEME_FILE_PATH, float32: bool = None, bad_rows: str = None, **kwargs):
+    # float32 and bad_rows ("raise", "coerce" or "drop") default to the LOADING
+    # section of schema.yaml. Clean files are parsed once, straight into the
+    # target dtypes; only a file with unparseable values is re-read and coerced
+    loading = _load_schema(schema_path).get("LOADING", {})
+    float32 = loading.get("float32", False) if float32 is None else float32
+    bad_rows = loading.get("bad_rows", "raise") if bad_rows is None else bad_rows
+    if bad_rows not in ("raise", "coerce", "drop"):
+        raise ValueError(f"bad_rows must be raise, coerce or drop, got {bad_rows}")
+
+    dtype = schema_dtypes(path, schema_path=schema_path, float32=float32)
+    kwargs.setdefault("usecols", list(dtype))
+
+    if kwargs.get("chunksize"):
+        # A typed chunked reader cannot recover from a bad value mid-file
+        return (_coerce_to_schema(chunk, dtype, bad_rows, path) for chunk in pd.read_csv(path, **kwargs))
+
+    try:
+        return pd.read_csv(path, dtype=dtype, **kwargs)
+    except ValueError:
+        return _coerce_to_schema(pd.read_csv(path, **kwargs), dtype, bad_rows, path)
@@ -0,0 +1,90 @@
+import shutil
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import ElasticNet
+
+from src.end_to_end_ds.components.batch_prediction import BatchPrediction
+from src.end_to_end_ds.config.configuration import ConfigurationManager
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FEATURES = [
+    "fixed acidity", "volatile acidity", "citric acid", "residual sugar", "chlorides",
+    "free sulfur dioxide", "total sulfur dioxide", "density", "pH", "sulphates", "alcohol",
+]
+CHUNK_SIZE = 1000
+
+
+@pytest.fixture
+def batch(tmp_path, monkeypatch):
+    # Every artifact path in config.yaml is relative, so run in a scratch copy
+    shutil.copytree(REPO_ROOT / "config", tmp_path / "config")
+    for name in ("params.yaml", "schema.yaml"):
+        shutil.copy(REPO_ROOT / name, tmp_path / name)
+    monkeypatch.chdir(tmp_path)
+
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.random((200, len(FEATURES))), columns=FEATURES)
+    (tmp_path / "artifacts" / "model_trainer").mkdir(parents=True)
+    joblib.dump(ElasticNet(alpha=0.01).fit(X, rng.random(200)), "artifacts/model_trainer/model.joblib")
+
+    config = ConfigurationManager().get_batch_prediction_config()
+    config.chunk_size = CHUNK_SIZE
+    bp = BatchPrediction(config)
+    yield bp
+    bp.executor.shutdown(wait=True)
+
+
+def _upload(tmp_path: Path, data: pd.DataFrame) -> Path:
+    path = tmp_path / "upload.csv"
+    data.to_csv(path, index=False)
+    return path
+
+
+def _run(bp: BatchPrediction, path: Path, output_format: str) -> str:
+    job_id = bp.submit(path, "wine.csv", output_format)
+    bp.executor.shutdown(wait=True)
+    return job_id
+
+
+def _wine(rows: int) -> pd.DataFrame:
+    data = pd.DataFrame(np.random.default_rng(1).random((rows, len(FEATURES))), columns=FEATURES)
+    data.insert(0, "sample_id", [f"s{i}" for i in range(rows)])
+    return data
+
+
+@pytest.mark.parametrize("output_format", ["csv", "parquet"])
+def test_passthrough_column_dtype_changes_between_chunks(batch, tmp_path, output_format):
+    data = _wine(2 * CHUNK_SIZE + 500)
+    # All ints in the first chunk, a float after it
+    data["extra"] = [str(i) for i in range(len(data))]
+    data.loc[CHUNK_SIZE + 10, "extra"] = "1.5"
+    # Empty in the first chunk, text after it
+    data["note"] = None
+    data.loc[CHUNK_SIZE + 20:, "note"] = "x"
+
+    job_id = _run(batch, _upload(tmp_path, data), output_format)
+    status = batch.status(job_id)
+    assert status["state"] == "done", status.get("error")
+
+    output = batch.output_path(job_id)
+    result = pd.read_parquet(output) if output_format == "parquet" else pd.read_csv(output, dtype={"extra": str})
+    assert list(result.columns) == list(data.columns) + ["prediction"]
+    assert result["sample_id"].tolist() == data["sample_id"].tolist()
+    assert result.loc[CHUNK_SIZE + 10, "extra"] == "1.5"
+    assert result["note"].isna().sum() == CHUNK_SIZE + 20
+    assert result["prediction"].notna().all()
+
+
+def test_failed_job_leaves_no_partial_output(batch, tmp_path):
+    data = _wine(2 * CHUNK_SIZE)
+    data["alcohol"] = data["alcohol"].astype(object)
+    data.loc[CHUNK_SIZE + 5, "alcohol"] = "not a number"
+
+    job_id = _run(batch, _upload(tmp_path, data), "csv")
+    assert batch.status(job_id)["state"] == "failed"
+    assert not list(batch._job_dir(job_id).glob("*.part"))